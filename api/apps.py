@@ -0,0 +1,48 @@
+from django.apps import AppConfig
+
+
+# REST_FRAMEWORK entries given as dotted paths. They can't be class objects in
+# settings.py (importing DRF there needs configured settings), so they are
+# resolved once at startup instead of on the first request.
+REST_FRAMEWORK_CLASS_SETTINGS = (
+    "DEFAULT_AUTHENTICATION_CLASSES",
+    "DEFAULT_PERMISSION_CLASSES",
+    "DEFAULT_RENDERER_CLASSES",
+    "DEFAULT_FILTER_BACKENDS",
+    "DEFAULT_PAGINATION_CLASS",
+)
+
+
+class ApiConfig(AppConfig):
+    default_auto_field = "django.db.models.BigAutoField"
+    name = "api"
+
+    def ready(self):
+        # Register signal handlers (cached-auth invalidation) and system checks.
+        from . import checks, signals  # noqa: F401
+
+        # api_settings caches each resolved value, so APIView and every view
+        # class pick up the imported classes; a bad path fails at boot.
+        from rest_framework.settings import api_settings
+
+        for setting in REST_FRAMEWORK_CLASS_SETTINGS:
+            getattr(api_settings, setting)
+
+        # Build AUTH_PASSWORD_VALIDATORS now (the instances are cached), so
+        # CommonPasswordValidator's gzipped word list is read once at boot and
+        # shared by preloaded workers, not parsed on the first password check.
+        from django.contrib.auth.password_validation import get_default_password_validators
+
+        get_default_password_validators()
+
+        # SimpleJWT builds one TokenBackend at import but each Token instance
+        # looks it up again with import_string. Prepare its keys now (a bad key
+        # fails at boot) and pin it on the Token class for every request.
+        # prepared_signing_key / prepared_verifying_key need SimpleJWT 5.5+.
+        from rest_framework_simplejwt.state import token_backend
+        from rest_framework_simplejwt.tokens import Token
+
+        token_backend.prepared_signing_key
+        if token_backend.verifying_key:
+            token_backend.prepared_verifying_key
+        Token._token_backend = token_backend
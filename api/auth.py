@@ -0,0 +1,114 @@
+"""
+api/auth.py
+-----------
+Authentication classes for the Task Management API.
+
+CachedJWTAuthentication behaves exactly like SimpleJWT's JWTAuthentication
+but avoids repeating work for tokens it has recently seen:
+
+  - Verified tokens are kept in a small process-local cache keyed by the
+    SHA-256 of the raw token, so repeat requests skip the HMAC check and
+    claim decoding. Entries never outlive the token's own `exp`, and
+    failures are never cached, so a tampered token is always re-verified.
+  - Refresh tokens that have been rotated are blacklisted in Django's cache
+    (see blacklist_token), not in the database-backed token_blacklist app,
+    so a refresh costs one atomic cache write instead of SQL round trips.
+  - The authenticated user is kept in Django's cache, so a request carrying
+    a valid token does not need a `SELECT ... FROM auth_user` before the
+    view runs. Cached users are dropped whenever the user row is saved or
+    deleted (see api/signals.py), so password changes and deactivation take
+    effect at once. That only holds if every worker sees the delete, so the
+    user cache is used only with a shared backend (see cache_is_shared);
+    with a per-process cache such as LocMemCache the user is loaded from the
+    database on every request.
+"""
+
+import hashlib
+import threading
+import time
+
+from cachetools import TTLCache
+from django.conf import settings
+from django.core.cache import cache
+from rest_framework_simplejwt.authentication import JWTAuthentication
+from rest_framework_simplejwt.settings import api_settings
+
+from .cache import cache_is_shared
+
+
+# Kept well below the access token lifetime (60 min).
+USER_CACHE_TIMEOUT = min(300, settings.ACCESS_TOKEN_LIFETIME_SECONDS)
+
+_token_cache_config = {
+    "max_entries": 10000,
+    "ttl": 30,
+    **getattr(settings, "JWT_VERIFICATION_CACHE", {}),
+}
+TOKEN_CACHE_TTL = _token_cache_config["ttl"]
+
+# sha256(raw token) -> (expires_at, validated token)
+_token_cache = TTLCache(maxsize=_token_cache_config["max_entries"], ttl=TOKEN_CACHE_TTL)
+_token_cache_lock = threading.Lock()
+
+
+def user_cache_key(user_id):
+    """Cache key under which the authenticated user with `user_id` is stored."""
+    return f"api:jwt-user:{user_id}"
+
+
+def invalidate_cached_user(user_id):
+    """Forget the cached user so the next request reloads it from the DB."""
+    cache.delete(user_cache_key(user_id))
+
+
+def token_blacklist_key(jti):
+    """Cache key marking the token with this `jti` as blacklisted."""
+    return f"api:jwt-blacklist:{jti}"
+
+
+def blacklist_token(token):
+    """
+    Blacklist `token` until it expires.
+
+    Returns False if it was already blacklisted. The check and the write are
+    a single atomic cache.add, so two requests can't both claim the token.
+    """
+    timeout = max(int(token["exp"] - time.time()), 1)
+    return cache.add(token_blacklist_key(token[api_settings.JTI_CLAIM]), True, timeout)
+
+
+class CachedJWTAuthentication(JWTAuthentication):
+    """JWT authentication that caches token verification and the user lookup."""
+
+    def get_validated_token(self, raw_token):
+        key = hashlib.sha256(raw_token).digest()
+        now = time.time()
+
+        with _token_cache_lock:
+            entry = _token_cache.get(key)
+        if entry is not None and entry[0] > now:
+            return entry[1]
+
+        # Raises on an invalid token; failures are never cached.
+        validated_token = super().get_validated_token(raw_token)
+
+        expires_at = min(validated_token.get("exp", now), now + TOKEN_CACHE_TTL)
+        if expires_at > now:
+            with _token_cache_lock:
+                _token_cache[key] = (expires_at, validated_token)
+        return validated_token
+
+    def get_user(self, validated_token):
+        user_id = validated_token.get(api_settings.USER_ID_CLAIM)
+        if user_id is None or not cache_is_shared():
+            # No id: let SimpleJWT raise its usual "no user identification"
+            # error. Per-process cache: other workers couldn't be invalidated.
+            return super().get_user(validated_token)
+
+        key = user_cache_key(user_id)
+        user = cache.get(key)
+        if user is None:
+            # Only users that pass SimpleJWT's checks (active, etc.) are cached.
+            user = super().get_user(validated_token)
+            cache.set(key, user, USER_CACHE_TIMEOUT)
+        return user
@@ -0,0 +1,52 @@
+"""
+api/cache.py
+------------
+Response caching helpers for the Task Management API.
+
+Category lists are cached per user. Instead of deleting keys by pattern
+(which only some backends support), each user has a version token that is
+part of every key; bumping the token on any category change makes all of
+that user's cached lists unreachable at once.
+"""
+
+import hashlib
+import time
+
+from django.conf import settings
+from django.core.cache import cache
+
+
+CATEGORY_LIST_CACHE_TIMEOUT = 300
+
+# Backends whose entries live inside one process; a delete in one worker is
+# invisible to the others.
+PROCESS_LOCAL_CACHE_BACKENDS = frozenset({
+    "django.core.cache.backends.locmem.LocMemCache",
+    "django.core.cache.backends.dummy.DummyCache",
+})
+
+
+def cache_is_shared():
+    """True when the default cache is shared by every worker process."""
+    return settings.CACHES["default"]["BACKEND"] not in PROCESS_LOCAL_CACHE_BACKENDS
+
+
+def _category_version_key(user_id):
+    return f"api:categories-version:{user_id}"
+
+
+def category_list_cache_key(user_id, url):
+    """Cache key for a user's category list as requested at `url`."""
+    version = cache.get(_category_version_key(user_id))
+    if version is None:
+        version = bump_category_version(user_id)
+    digest = hashlib.md5(url.encode(), usedforsecurity=False).hexdigest()
+    return f"api:categories:{user_id}:{version}:{digest}"
+
+
+def bump_category_version(user_id):
+    """Invalidate every cached category list for `user_id`."""
+    # A timestamp never repeats, so an evicted version can't revive old entries.
+    version = time.time_ns()
+    cache.set(_category_version_key(user_id), version, None)
+    return version
@@ -0,0 +1,28 @@
+"""
+api/checks.py
+-------------
+System checks for deployment settings the API relies on; they run with
+`manage.py check --deploy`.
+"""
+
+from django.core.checks import Error, Tags, register
+from rest_framework_simplejwt.settings import api_settings as jwt_settings
+
+from .cache import cache_is_shared
+
+
+@register(Tags.security, Tags.caches, deploy=True)
+def check_token_blacklist_cache(app_configs, **kwargs):
+    """Refuse a per-process cache for the refresh-token blacklist in production."""
+    blacklisting = jwt_settings.ROTATE_REFRESH_TOKENS and jwt_settings.BLACKLIST_AFTER_ROTATION
+    if not blacklisting or cache_is_shared():
+        return []
+    return [
+        Error(
+            "Rotated refresh tokens are blacklisted in a per-process cache, so "
+            "they can be reused on any other worker.",
+            hint="Point CACHES['default'] at a shared backend such as RedisCache "
+            "(set REDIS_URL), or disable BLACKLIST_AFTER_ROTATION.",
+            id="api.E001",
+        )
+    ]
@@ -0,0 +1,57 @@
+"""
+Pre-render the frontend pages to static HTML.
+
+Each page routed to a CachedPageView is written to
+<output-dir>/<route>index.html (the login page at "" becomes index.html), so
+a front web server or CDN can answer those URLs without reaching Django, e.g.
+with nginx:
+
+    try_files /static/pages${uri}index.html @django;
+
+Run it whenever a template changes. With the manifest static storage (DEBUG
+off) the pages link to hashed asset names, so run collectstatic first, then
+this command, then collectstatic again to compress the pages themselves.
+"""
+
+import os
+
+from django.conf import settings
+from django.core.management.base import BaseCommand
+from django.urls import URLPattern, get_resolver
+
+from taskmanager.views import CachedPageView, render_page
+
+
+class Command(BaseCommand):
+    help = "Render the frontend page templates to static HTML files."
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--output-dir",
+            default=os.path.join(settings.STATICFILES_DIRS[0], "pages"),
+            help="Directory to write the rendered pages to (default: static/pages).",
+        )
+
+    def handle(self, *args, **options):
+        output_dir = options["output_dir"]
+        for route, template_name in self.iter_pages():
+            path = os.path.join(output_dir, route, "index.html")
+            os.makedirs(os.path.dirname(path), exist_ok=True)
+            with open(path, "wb") as f:
+                f.write(render_page(template_name)[0])
+            self.stdout.write(f"/{route} -> {path}")
+
+    def iter_pages(self):
+        """Yield (route, template_name) for every top-level page route."""
+        for pattern in get_resolver().url_patterns:
+            view_class = getattr(getattr(pattern, "callback", None), "view_class", None)
+            if not (
+                isinstance(pattern, URLPattern)
+                and view_class is not None
+                and issubclass(view_class, CachedPageView)
+            ):
+                continue
+            template_name = pattern.callback.view_initkwargs.get(
+                "template_name", view_class.template_name
+            )
+            yield str(pattern.pattern), template_name
@@ -0,0 +1,38 @@
+# Generated by Django 4.2.30 on 2026-10-15 02:29
+
+from django.db import migrations, models
+import django.db.models.functions.text
+
+
+# auth.User belongs to another app, so its index is created directly through
+# the schema editor rather than via AddIndex on this app's migration state.
+USERNAME_INDEX = models.Index(
+    django.db.models.functions.text.Upper('username'),
+    name='auth_user_iname_idx',
+)
+
+
+def add_username_index(apps, schema_editor):
+    User = apps.get_model('auth', 'User')
+    schema_editor.add_index(User, USERNAME_INDEX)
+
+
+def remove_username_index(apps, schema_editor):
+    User = apps.get_model('auth', 'User')
+    schema_editor.remove_index(User, USERNAME_INDEX)
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('api', '0001_initial'),
+        ('auth', '0012_alter_user_first_name_max_length'),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='category',
+            index=models.Index(models.F('user'), django.db.models.functions.text.Upper('name'), name='cat_user_iname_idx'),
+        ),
+        migrations.RunPython(add_username_index, remove_username_index),
+    ]
@@ -0,0 +1,37 @@
+from django.db import migrations, models
+import django.db.models.functions.text
+
+
+# Replaces the plain UPPER(username) index from 0002 with a unique one so the
+# database rejects usernames that differ only in case.
+OLD_USERNAME_INDEX = models.Index(
+    django.db.models.functions.text.Upper('username'),
+    name='auth_user_iname_idx',
+)
+USERNAME_CONSTRAINT = models.UniqueConstraint(
+    django.db.models.functions.text.Upper('username'),
+    name='auth_user_iname_uniq',
+)
+
+
+def make_username_index_unique(apps, schema_editor):
+    User = apps.get_model('auth', 'User')
+    schema_editor.remove_index(User, OLD_USERNAME_INDEX)
+    schema_editor.add_constraint(User, USERNAME_CONSTRAINT)
+
+
+def restore_username_index(apps, schema_editor):
+    User = apps.get_model('auth', 'User')
+    schema_editor.remove_constraint(User, USERNAME_CONSTRAINT)
+    schema_editor.add_index(User, OLD_USERNAME_INDEX)
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('api', '0002_case_insensitive_name_indexes'),
+    ]
+
+    operations = [
+        migrations.RunPython(make_username_index_unique, restore_username_index),
+    ]
@@ -1,6 +1,7 @@
 from django.db import models
 from django.contrib.auth.models import User
-from django.utils import timezone
+from django.db.models import Case, Value, When
+from django.db.models.functions import Now, Upper
 
 
 # Category
@@ -27,11 +28,47 @@ class Category(models.Model):
         ordering = ["name"]
         # A user cannot have two categories with the same name.
         unique_together = [("user", "name")]
+        # Backs the case-insensitive (name__iexact) duplicate check in
+        # CategorySerializer, which compiles to UPPER(name) = UPPER(%s).
+        indexes = [models.Index("user", Upper("name"), name="cat_user_iname_idx")]
         verbose_name_plural = "categories"
 
 
 # Task
 
+class TaskQuerySet(models.QuerySet):
+    """Custom queryset exposing single-statement task mutations."""
+
+    def toggle(self, pk, user, status=None):
+        """
+        Flip (or explicitly set) a task's status in one UPDATE.
+
+        With `status=None` the new status is derived from the current row via
+        CASE expressions, so the task never has to be loaded into Python.
+        Returns the number of rows updated (0 if the task is not the user's).
+        """
+        if status is None:
+            was_pending = When(status=_PENDING, then=Now())
+            completed_at = Case(
+                was_pending, default=Value(None), output_field=models.DateTimeField()
+            )
+            new_status = Case(
+                When(status=_PENDING, then=Value(_COMPLETED)), default=Value(_PENDING)
+            )
+        elif status == _COMPLETED:
+            completed_at, new_status = Now(), _COMPLETED
+        else:
+            completed_at, new_status = None, _PENDING
+
+        # completed_at is assigned before status so backends that evaluate SET
+        # clauses left to right (MySQL) still see the old status in its CASE.
+        return self.filter(pk=pk, user=user).update(
+            completed_at=completed_at,
+            status=new_status,
+            updated_at=Now(),
+        )
+
+
 class Task(models.Model):
     """Represents a single task owned by a user."""
 
@@ -91,19 +128,34 @@ class Task(models.Model):
     created_at = models.DateTimeField(auto_now_add=True)
     updated_at = models.DateTimeField(auto_now=True)
 
+    objects = TaskQuerySet.as_manager()
+
     # Methods
 
     def mark_complete(self):
-        """Mark this task as COMPLETED and record the timestamp."""
-        self.status = self.Status.COMPLETED
-        self.completed_at = timezone.now()
-        self.save()
+        """Mark this task as COMPLETED and record the timestamp (DB clock)."""
+        self._write_status(_COMPLETED, completed_at=Now())
 
     def mark_incomplete(self):
         """Revert a task to PENDING and clear the completion timestamp."""
-        self.status = self.Status.PENDING
-        self.completed_at = None
-        self.save()
+        self._write_status(_PENDING, completed_at=None)
+
+    def _write_status(self, status, completed_at):
+        """
+        Persist a status change with a single UPDATE, bypassing save().
+
+        Timestamps are generated by the database's NOW(), so they are dropped
+        from the instance and lazily reloaded if accessed afterwards.
+        """
+        Task.objects.filter(pk=self.pk).update(
+            status=status, completed_at=completed_at, updated_at=Now()
+        )
+        self.status = status
+        self.__dict__.pop("updated_at", None)
+        if completed_at is None:
+            self.completed_at = None
+        else:
+            self.__dict__.pop("completed_at", None)
 
     def __str__(self):
         return f"[{self.priority}] {self.title} — {self.status}"
@@ -111,3 +163,19 @@ class Task(models.Model):
     class Meta:
         # Most recent tasks appear first by default
         ordering = ["-created_at"]
+        # Match the typical list query: WHERE user_id=? [AND status=?]
+        # ORDER BY created_at DESC, plus due-date filtering per user.
+        # (user, status) lookups use the prefix of the second index.
+        indexes = [
+            models.Index(fields=["user", "-created_at"], name="task_user_created"),
+            models.Index(
+                fields=["user", "status", "-created_at"],
+                name="task_user_status_created",
+            ),
+            models.Index(fields=["user", "due_date"], name="task_user_due_date"),
+        ]
+
+
+# Status members resolved once for the hot status helpers above.
+_COMPLETED = Task.Status.COMPLETED
+_PENDING = Task.Status.PENDING
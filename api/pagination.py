@@ -0,0 +1,65 @@
+"""
+api/pagination.py
+-----------------
+Pagination classes for the Task Management API.
+
+StandardCursorPagination is the project-wide default (see REST_FRAMEWORK in
+settings): keyset pagination avoids the COUNT(*) and deep OFFSET scans of
+page numbers, so clients follow the `next`/`previous` links instead of
+asking for ?page=N.
+
+StandardPagination is the page-number opt-in for views that need random
+access. TaskPagination builds on it for the task list, whose frontend pages
+by number, and switches to cursor pagination when a client asks for it.
+"""
+
+from rest_framework.pagination import CursorPagination, PageNumberPagination
+
+
+class StandardPagination(PageNumberPagination):
+    """Page-number pagination; clients may pass ?page_size=N (max 100)."""
+
+    page_size_query_param = "page_size"
+    max_page_size = 100
+
+
+class StandardCursorPagination(CursorPagination):
+    """
+    Keyset pagination, newest first; clients may pass ?page_size=N (max 100).
+
+    Views with an OrderingFilter page by their own (or the client's) ordering.
+    """
+
+    ordering = "-created_at"
+    page_size_query_param = "page_size"
+    max_page_size = 100
+
+
+class TaskCursorPagination(StandardCursorPagination):
+    """Keyset pagination over tasks, newest first (backed by an index)."""
+
+    page_size = 20
+
+
+class TaskPagination(StandardPagination):
+    """
+    Page-number pagination, switching to cursor pagination on request.
+
+    Sending a `cursor` query parameter (empty for the first page) returns a
+    `{"next", "previous", "results"}` page with no `count`; clients then
+    follow the `next`/`previous` links.
+    """
+
+    cursor_class = TaskCursorPagination
+
+    def paginate_queryset(self, queryset, request, view=None):
+        if self.cursor_class.cursor_query_param in request.query_params:
+            self.cursor_paginator = self.cursor_class()
+            return self.cursor_paginator.paginate_queryset(queryset, request, view)
+        self.cursor_paginator = None
+        return super().paginate_queryset(queryset, request, view)
+
+    def get_paginated_response(self, data):
+        if self.cursor_paginator is not None:
+            return self.cursor_paginator.get_paginated_response(data)
+        return super().get_paginated_response(data)
@@ -1,13 +1,43 @@
+import copy
+
 from django.contrib.auth.models import User
+from django.db import IntegrityError, transaction
+from django.utils.translation import gettext_lazy as _
 from rest_framework import serializers
+from rest_framework_simplejwt.exceptions import TokenError
+from rest_framework_simplejwt.serializers import TokenRefreshSerializer
+from rest_framework_simplejwt.settings import api_settings as jwt_settings
 
+from .auth import blacklist_token
 from .models import Category, Task
 
 
+# Shared
+
+
+class CachedFieldsMixin:
+    """
+    Build a ModelSerializer's fields once per class, not once per instance.
+
+    ModelSerializer.get_fields() re-introspects the model and rebuilds every
+    field each time a serializer is created. The result only depends on the
+    class's Meta, so it is computed once and each instance gets a deep copy
+    (the same way DRF already copies declared fields).
+    """
+
+    def get_fields(self):
+        cls = type(self)
+        cached = cls.__dict__.get("_cached_fields")
+        if cached is None:
+            cached = super().get_fields()
+            cls._cached_fields = cached
+        return copy.deepcopy(cached)
+
+
 # Category
 
 
-class CategorySerializer(serializers.ModelSerializer):
+class CategorySerializer(CachedFieldsMixin, serializers.ModelSerializer):
     """
     Serializer for Category.
 
@@ -44,7 +74,22 @@ class CategorySerializer(serializers.ModelSerializer):
 
 # Task
 
-class TaskSerializer(serializers.ModelSerializer):
+class TaskBulkListSerializer(serializers.ListSerializer):
+    """
+    List serializer used when a client POSTs an array of tasks.
+
+    Inserts all tasks with `bulk_create` in batches instead of issuing one
+    INSERT per task.
+    """
+
+    BATCH_SIZE = 40
+
+    def create(self, validated_data):
+        tasks = [Task(**attrs) for attrs in validated_data]
+        return Task.objects.bulk_create(tasks, batch_size=self.BATCH_SIZE)
+
+
+class TaskSerializer(CachedFieldsMixin, serializers.ModelSerializer):
     """
     Serializer for Task.
 
@@ -55,8 +100,9 @@ class TaskSerializer(serializers.ModelSerializer):
       - `completed_at`  – read-only; managed by mark_complete/mark_incomplete.
 
     Validation:
-      - `validate_category` ensures the supplied category belongs to the
-        requesting user, preventing cross-user category assignment.
+      - `category` is looked up only among the requesting user's categories
+        (see `get_fields`), so another user's category id is rejected as
+        non-existent in the same query that resolves it.
       - DRF automatically validates `priority` and `status` against their
         TextChoices, so no manual validator is needed for those fields.
     """
@@ -87,22 +133,40 @@ class TaskSerializer(serializers.ModelSerializer):
         ]
         # completed_at is managed exclusively by model helpers via the toggle action.
         read_only_fields = ["completed_at", "created_at", "updated_at"]
+        # POSTing a JSON array creates all tasks in batched INSERTs.
+        list_serializer_class = TaskBulkListSerializer
 
-    def validate_category(self, value):
-        """
-        Prevent a user from assigning another user's category to their task.
-
-        Raises ValidationError if the submitted category does not belong to
-        the authenticated user making the request.
-        """
-        if value is None:
-            return value
+    def get_fields(self):
+        """Scope the writable `category` FK to the requesting user's categories."""
+        fields = super().get_fields()
         request = self.context.get("request")
-        if value.user != request.user:
-            raise serializers.ValidationError(
-                "You can only assign your own categories to your tasks."
-            )
-        return value
+        if request is not None:
+            fields["category"].queryset = Category.objects.filter(user=request.user)
+        return fields
+
+
+class TaskListSerializer(TaskSerializer):
+    """
+    Slimmer Task representation used for list responses.
+
+    Omits `user` (always the requesting user on this endpoint) and
+    `updated_at`, so the list query needs neither the auth_user join nor
+    those columns. `description` stays because the task cards render it.
+    """
+
+    class Meta(TaskSerializer.Meta):
+        fields = [
+            "id",
+            "title",
+            "description",
+            "due_date",
+            "priority",
+            "status",
+            "completed_at",
+            "category",
+            "category_name",
+            "created_at",
+        ]
 
 
 # User Registration
@@ -114,17 +178,41 @@ class UserRegisterSerializer(serializers.Serializer):
     email = serializers.EmailField(required=False, allow_blank=True)
     password = serializers.CharField(min_length=8, write_only=True)
 
-    def validate_username(self, value):
-        """Ensure the username is not already taken."""
-        if User.objects.filter(username__iexact=value).exists():
+    def create(self, validated_data):
+        """
+        Create the user in a single INSERT.
+
+        Username uniqueness (case-insensitive) is enforced by the database,
+        so a duplicate surfaces as an IntegrityError instead of a separate
+        existence query that could race with a concurrent registration.
+        """
+        try:
+            with transaction.atomic():
+                return User.objects.create_user(
+                    username=validated_data["username"],
+                    email=validated_data.get("email", ""),
+                    password=validated_data["password"],
+                )
+        except IntegrityError:
             raise serializers.ValidationError(
-                "A user with this username already exists."
+                {"username": ["A user with this username already exists."]}
             )
-        return value
 
-    def create(self, validated_data):
-        return User.objects.create_user(
-            username=validated_data["username"],
-            email=validated_data.get("email", ""),
-            password=validated_data["password"],
-        )
+
+# JWT
+
+
+class BlacklistingTokenRefreshSerializer(TokenRefreshSerializer):
+    """
+    Refresh serializer that blacklists rotated refresh tokens in the cache.
+
+    Used via SIMPLE_JWT["TOKEN_REFRESH_SERIALIZER"]; a refresh token can be
+    exchanged once, a second attempt is rejected like any invalid token.
+    """
+
+    def validate(self, attrs):
+        if jwt_settings.ROTATE_REFRESH_TOKENS and jwt_settings.BLACKLIST_AFTER_ROTATION:
+            refresh = self.token_class(attrs["refresh"])
+            if not blacklist_token(refresh):
+                raise TokenError(_("Token is blacklisted"))
+        return super().validate(attrs)
@@ -0,0 +1,37 @@
+"""
+api/signals.py
+--------------
+Signal handlers for the Task Management API.
+
+Connected in ApiConfig.ready() so they are active in every process, not
+only in ones that happened to import the authentication module.
+"""
+
+from django.contrib.auth.models import User
+from django.db.models.signals import post_delete, post_save
+from django.dispatch import receiver
+
+from .auth import invalidate_cached_user
+from .cache import bump_category_version
+from .models import Category
+
+
+@receiver(post_save, sender=User)
+@receiver(post_delete, sender=User)
+def drop_cached_auth_user(sender, instance, created=False, **kwargs):
+    """
+    Invalidate the cached JWT user and the user's cached category lists
+    (which render the owner's username) whenever the account changes.
+    """
+    # A brand-new account can't have cache entries yet; skipping it keeps
+    # registration to the INSERT alone.
+    if not created:
+        invalidate_cached_user(instance.pk)
+        bump_category_version(instance.pk)
+
+
+@receiver(post_save, sender=Category)
+@receiver(post_delete, sender=Category)
+def drop_cached_category_lists(sender, instance, **kwargs):
+    """Invalidate the owner's cached category lists on any category change."""
+    bump_category_version(instance.user_id)
@@ -1,23 +1,50 @@
+import os
+import tempfile
 from datetime import date
+from io import StringIO
+from unittest import mock
 
 from django.contrib.auth.models import User
-from django.test import TestCase
+from django.core.cache import cache
+from django.core.management import call_command
+from django.db import connection
+from django.http import HttpResponse
+from django.test import RequestFactory, TestCase, override_settings
+from django.test.utils import CaptureQueriesContext
 from django.utils import timezone
 from rest_framework import status
+from rest_framework.renderers import JSONRenderer
 from rest_framework.test import APIClient, APITestCase
+from rest_framework_simplejwt.tokens import RefreshToken
 
+from taskmanager.middleware import SessionMiddleware
+from taskmanager.views import _rendered_pages
+
+from .auth import user_cache_key
+from .checks import check_token_blacklist_cache
 from .models import Category, Task
+from .renderers import ORJSONRenderer
+
+
+# Fixture users don't need a production-strength password hash.
+FAST_PASSWORD_HASHERS = ["django.contrib.auth.hashers.MD5PasswordHasher"]
+
+# Tests that touch the cache run against LocMem whatever REDIS_URL says, so
+# cache.clear() never flushes a real Redis database.
+LOCMEM_CACHES = {"default": {"BACKEND": "django.core.cache.backends.locmem.LocMemCache"}}
 
 
 
 # Unit tests — model logic
 
+@override_settings(PASSWORD_HASHERS=FAST_PASSWORD_HASHERS, CACHES=LOCMEM_CACHES)
 class CategoryModelTest(TestCase):
     """Unit tests for the Category model."""
 
-    def setUp(self):
-        self.user = User.objects.create_user(username="alice", password="pass1234")
-        self.category = Category.objects.create(user=self.user, name="Work")
+    @classmethod
+    def setUpTestData(cls):
+        cls.user = User.objects.create_user(username="alice", password="pass1234")
+        cls.category = Category.objects.create(user=cls.user, name="Work")
 
     def test_str_representation(self):
         """__str__ should include the category name and owner username."""
@@ -32,13 +59,15 @@ class CategoryModelTest(TestCase):
         self.assertEqual(names, sorted(names))
 
 
+@override_settings(PASSWORD_HASHERS=FAST_PASSWORD_HASHERS)
 class TaskModelTest(TestCase):
     """Unit tests for the Task model."""
 
-    def setUp(self):
-        self.user = User.objects.create_user(username="bob", password="pass1234")
-        self.task = Task.objects.create(
-            user=self.user,
+    @classmethod
+    def setUpTestData(cls):
+        cls.user = User.objects.create_user(username="bob", password="pass1234")
+        cls.task = Task.objects.create(
+            user=cls.user,
             title="Write tests",
             due_date=date.today(),
         )
@@ -49,6 +78,19 @@ class TaskModelTest(TestCase):
         self.assertIn("Write tests", result)
         self.assertIn(self.task.priority, result)
 
+    def test_str_reflects_saved_changes(self):
+        """__str__ should not keep a stale label after the task is saved again."""
+        str(self.task)
+        self.task.mark_complete()
+        self.assertIn(Task.Status.COMPLETED, str(self.task))
+
+    def test_str_reflects_queryset_update(self):
+        """__str__ should show the current title after an update() + refresh."""
+        str(self.task)
+        Task.objects.filter(pk=self.task.pk).update(title="Renamed")
+        self.task.refresh_from_db()
+        self.assertIn("Renamed", str(self.task))
+
     def test_default_status_is_pending(self):
         """Newly created tasks should have PENDING status."""
         self.assertEqual(self.task.status, Task.Status.PENDING)
@@ -60,7 +102,7 @@ class TaskModelTest(TestCase):
     def test_mark_complete_sets_status_and_timestamp(self):
         """mark_complete() should set status to COMPLETED and record completed_at."""
         self.task.mark_complete()
-        self.task.refresh_from_db()
+        self.task.refresh_from_db(fields=["status", "completed_at"])
         self.assertEqual(self.task.status, Task.Status.COMPLETED)
         self.assertIsNotNone(self.task.completed_at)
 
@@ -68,7 +110,7 @@ class TaskModelTest(TestCase):
         """mark_incomplete() should revert to PENDING and clear completed_at."""
         self.task.mark_complete()
         self.task.mark_incomplete()
-        self.task.refresh_from_db()
+        self.task.refresh_from_db(fields=["status", "completed_at"])
         self.assertEqual(self.task.status, Task.Status.PENDING)
         self.assertIsNone(self.task.completed_at)
 
@@ -98,37 +140,101 @@ class AuthEnforcementTest(APITestCase):
         self.assertEqual(response.status_code, status.HTTP_401_UNAUTHORIZED)
 
 
+@override_settings(PASSWORD_HASHERS=FAST_PASSWORD_HASHERS, CACHES=LOCMEM_CACHES)
+class TokenAPITest(APITestCase):
+    """Integration tests for the JWT token endpoints."""
+
+    @classmethod
+    def setUpTestData(cls):
+        cls.user = User.objects.create_user(username="ivan", password="pass1234")
+
+    def test_obtain_token_pair(self):
+        """POST /api/token/ with valid credentials should return access + refresh."""
+        response = self.client.post(
+            "/api/token/", {"username": "ivan", "password": "pass1234"}, format="json"
+        )
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertIn("access", response.data)
+        self.assertIn("refresh", response.data)
+
+    def test_obtain_token_rejects_bad_password(self):
+        """POST /api/token/ with a wrong password should return 401."""
+        response = self.client.post(
+            "/api/token/", {"username": "ivan", "password": "wrong"}, format="json"
+        )
+        self.assertEqual(response.status_code, status.HTTP_401_UNAUTHORIZED)
+
+    def test_access_token_authenticates_api_requests(self):
+        """An access token from /api/token/ should be accepted by the API."""
+        response = self.client.post(
+            "/api/token/", {"username": "ivan", "password": "pass1234"}, format="json"
+        )
+        self.client.credentials(HTTP_AUTHORIZATION=f"Bearer {response.data['access']}")
+        self.assertEqual(self.client.get("/api/tasks/").status_code, status.HTTP_200_OK)
+
+    def test_token_backend_not_looked_up_per_request(self):
+        """Verifying a token should reuse the startup TokenBackend."""
+        token = str(RefreshToken.for_user(self.user).access_token)
+        self.client.credentials(HTTP_AUTHORIZATION=f"Bearer {token}")
+        with mock.patch("rest_framework_simplejwt.tokens.import_string") as lookup:
+            response = self.client.get("/api/tasks/")
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        lookup.assert_not_called()
+
+    def test_rotated_refresh_token_cannot_be_reused(self):
+        """A refresh token should be accepted once, then rejected as blacklisted."""
+        refresh = str(RefreshToken.for_user(self.user))
+        response = self.client.post("/api/token/refresh/", {"refresh": refresh}, format="json")
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertIn("refresh", response.data)
+
+        response = self.client.post("/api/token/refresh/", {"refresh": refresh}, format="json")
+        self.assertEqual(response.status_code, status.HTTP_401_UNAUTHORIZED)
+
+    def test_tampered_token_rejected_after_valid_token_cached(self):
+        """Verification caching must not let a modified token through."""
+        token = str(RefreshToken.for_user(self.user).access_token)
+        self.client.credentials(HTTP_AUTHORIZATION=f"Bearer {token}")
+        self.assertEqual(self.client.get("/api/tasks/").status_code, status.HTTP_200_OK)
+
+        header, payload, signature = token.split(".")
+        tampered = ".".join([header, payload, signature[::-1]])
+        self.client.credentials(HTTP_AUTHORIZATION=f"Bearer {tampered}")
+        response = self.client.get("/api/tasks/")
+        self.assertEqual(response.status_code, status.HTTP_401_UNAUTHORIZED)
+
+
+@override_settings(PASSWORD_HASHERS=FAST_PASSWORD_HASHERS, CACHES=LOCMEM_CACHES)
 class TaskAPITest(APITestCase):
     """Integration tests for the Task endpoints."""
 
-    def setUp(self):
+    @classmethod
+    def setUpTestData(cls):
         # Primary user
-        self.user = User.objects.create_user(username="carol", password="pass1234")
+        cls.user = User.objects.create_user(username="carol", password="pass1234")
         # Secondary user — should NOT be able to access carol's tasks
-        self.other_user = User.objects.create_user(username="dave", password="pass1234")
-
-        # Authenticate as the primary user via JWT
-        response = self.client.post(
-            "/api/token/",
-            {"username": "carol", "password": "pass1234"},
-            format="json",
-        )
-        self.token = response.data["access"]
-        self.client.credentials(HTTP_AUTHORIZATION=f"Bearer {self.token}")
+        cls.other_user = User.objects.create_user(username="dave", password="pass1234")
 
         # Create a task owned by carol
-        self.task = Task.objects.create(
-            user=self.user,
+        cls.task = Task.objects.create(
+            user=cls.user,
             title="Carol's task",
             due_date=date.today(),
         )
         # Create a task owned by dave
-        self.other_task = Task.objects.create(
-            user=self.other_user,
+        cls.other_task = Task.objects.create(
+            user=cls.other_user,
             title="Dave's task",
             due_date=date.today(),
         )
 
+    def setUp(self):
+        # Authenticate as the primary user via JWT (self.client is per-test).
+        # The token is minted directly; TokenAPITest covers /api/token/.
+        cache.clear()
+        self.token = str(RefreshToken.for_user(self.user).access_token)
+        self.client.credentials(HTTP_AUTHORIZATION=f"Bearer {self.token}")
+
     def test_list_returns_only_own_tasks(self):
         """GET /api/tasks/ should only return the authenticated user's tasks."""
         response = self.client.get("/api/tasks/")
@@ -137,6 +243,116 @@ class TaskAPITest(APITestCase):
         self.assertIn("Carol's task", titles)
         self.assertNotIn("Dave's task", titles)
 
+    def test_list_query_count_does_not_grow_with_rows(self):
+        """GET /api/tasks/ should not issue per-task queries for user/category."""
+        category = Category.objects.create(user=self.user, name="Errands")
+
+        def count_list_queries():
+            with CaptureQueriesContext(connection) as ctx:
+                response = self.client.get("/api/tasks/")
+            self.assertEqual(response.status_code, status.HTTP_200_OK)
+            return len(ctx.captured_queries)
+
+        count_list_queries()    # warm the cached auth user lookup
+        baseline = count_list_queries()
+        for i in range(5):
+            Task.objects.create(
+                user=self.user, title=f"Extra {i}", due_date=date.today(), category=category
+            )
+        self.assertEqual(count_list_queries(), baseline)
+
+    @mock.patch("api.auth.cache_is_shared", return_value=True)
+    def test_deactivated_user_rejected_after_cached_auth(self, _shared):
+        """Deactivating a user must take effect even after their lookup was cached."""
+        self.assertEqual(self.client.get("/api/tasks/").status_code, status.HTTP_200_OK)
+        self.assertIsNotNone(cache.get(user_cache_key(self.user.pk)))
+        self.user.is_active = False
+        self.user.save()
+        response = self.client.get("/api/tasks/")
+        self.assertEqual(response.status_code, status.HTTP_401_UNAUTHORIZED)
+
+    def test_user_not_cached_in_process_local_cache(self):
+        """With LocMemCache, other workers can't be invalidated, so nothing is cached."""
+        self.assertEqual(self.client.get("/api/tasks/").status_code, status.HTTP_200_OK)
+        self.assertIsNone(cache.get(user_cache_key(self.user.pk)))
+
+    def test_bearer_request_skips_session_lookup(self):
+        """A JWT request must not read the session, even with a session cookie."""
+        self.client.force_login(self.user)
+        with CaptureQueriesContext(connection) as ctx:
+            response = self.client.get("/api/tasks/")
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertFalse(
+            [q for q in ctx.captured_queries if "django_session" in q["sql"]]
+        )
+
+    def test_list_honours_page_size(self):
+        """GET /api/tasks/?page_size=N should return at most N tasks per page."""
+        for i in range(3):
+            Task.objects.create(user=self.user, title=f"Paged {i}", due_date=date.today())
+        response = self.client.get("/api/tasks/", {"page_size": 2})
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(len(response.data["results"]), 2)
+        self.assertEqual(response.data["count"], 4)
+
+    def test_list_cursor_pagination(self):
+        """GET /api/tasks/?cursor= should page by cursor without a count."""
+        for i in range(3):
+            Task.objects.create(user=self.user, title=f"Paged {i}", due_date=date.today())
+        response = self.client.get("/api/tasks/", {"cursor": "", "page_size": 2})
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertNotIn("count", response.data)
+        self.assertEqual(len(response.data["results"]), 2)
+        self.assertIsNotNone(response.data["next"])
+
+        response = self.client.get(response.data["next"])
+        self.assertEqual(len(response.data["results"]), 2)
+        self.assertIsNone(response.data["next"])
+
+    def test_filter_by_status_and_priority(self):
+        """GET /api/tasks/?status=&priority= should return only matching tasks."""
+        Task.objects.create(
+            user=self.user, title="Urgent", due_date=date.today(), priority="HIGH"
+        )
+        response = self.client.get("/api/tasks/", {"status": "PENDING", "priority": "HIGH"})
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        titles = [t["title"] for t in response.data["results"]]
+        self.assertEqual(titles, ["Urgent"])
+
+    def test_search_and_ordering(self):
+        """?search= should match title/description and ?ordering= should sort."""
+        Task.objects.create(
+            user=self.user, title="Alpha", description="quarterly report", due_date=date(2030, 1, 2)
+        )
+        Task.objects.create(
+            user=self.user, title="Beta report", due_date=date(2030, 1, 1)
+        )
+        response = self.client.get("/api/tasks/", {"search": "report", "ordering": "due_date"})
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        titles = [t["title"] for t in response.data["results"]]
+        self.assertEqual(titles, ["Beta report", "Alpha"])
+
+    def test_invalid_filter_value_rejected(self):
+        """Malformed filter values should return 400 rather than an empty list."""
+        for params in ({"due_date": "not-a-date"}, {"status": "DONE"}, {"category": "x"}):
+            response = self.client.get("/api/tasks/", params)
+            self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST, params)
+
+    def test_category_filter_limited_to_own_categories(self):
+        """?category= should filter by an own category and 400 on unknown or foreign ids."""
+        own = Category.objects.create(user=self.user, name="Errands")
+        foreign = Category.objects.create(user=self.other_user, name="Dave's")
+        Task.objects.create(user=self.user, title="Shop", due_date=date.today(), category=own)
+
+        response = self.client.get("/api/tasks/", {"category": own.pk})
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual([t["title"] for t in response.data["results"]], ["Shop"])
+
+        for pk in (foreign.pk, foreign.pk + 1000):
+            response = self.client.get("/api/tasks/", {"category": pk})
+            self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST, pk)
+            self.assertIn("category", response.data)
+
     def test_create_task(self):
         """POST /api/tasks/ should create a task owned by the requesting user."""
         payload = {
@@ -148,12 +364,60 @@ class TaskAPITest(APITestCase):
         self.assertEqual(response.status_code, status.HTTP_201_CREATED)
         self.assertEqual(response.data["user"], "carol")
 
+    def test_bulk_create_tasks(self):
+        """POST /api/tasks/ with a JSON array should create every task for the user."""
+        payload = [
+            {"title": f"Bulk task {i}", "due_date": str(date.today())}
+            for i in range(3)
+        ]
+        response = self.client.post("/api/tasks/", payload, format="json")
+        self.assertEqual(response.status_code, status.HTTP_201_CREATED)
+        self.assertEqual(len(response.data), 3)
+        self.assertEqual(
+            Task.objects.filter(user=self.user, title__startswith="Bulk task").count(), 3
+        )
+
+    def test_update_with_array_body_rejected(self):
+        """PUT/PATCH /api/tasks/<id>/ with a JSON array should return 400, not bulk-update."""
+        payload = [{"title": "Array body", "due_date": str(date.today())}]
+        for method in (self.client.put, self.client.patch):
+            response = method(f"/api/tasks/{self.task.pk}/", payload, format="json")
+            self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
+
+    def test_invalid_priority_rejected(self):
+        """POST /api/tasks/ with a priority outside the TextChoices should return 400."""
+        payload = {
+            "title": "Bad priority",
+            "due_date": str(date.today()),
+            "priority": "URGENT",
+        }
+        response = self.client.post("/api/tasks/", payload, format="json")
+        self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
+        self.assertIn("priority", response.data)
+
     def test_retrieve_own_task(self):
         """GET /api/tasks/<id>/ should return the task for its owner."""
         response = self.client.get(f"/api/tasks/{self.task.pk}/")
         self.assertEqual(response.status_code, status.HTTP_200_OK)
         self.assertEqual(response.data["title"], "Carol's task")
 
+    def test_retrieve_conditional_get(self):
+        """GET /api/tasks/<id>/ should honour If-None-Match until the task changes."""
+        url = f"/api/tasks/{self.task.pk}/"
+        etag = self.client.get(url)["ETag"]
+
+        response = self.client.get(url, HTTP_IF_NONE_MATCH=etag)
+        self.assertEqual(response.status_code, status.HTTP_304_NOT_MODIFIED)
+
+        # Proxies that compress the body send the weak form back.
+        response = self.client.get(url, HTTP_IF_NONE_MATCH=f"W/{etag}")
+        self.assertEqual(response.status_code, status.HTTP_304_NOT_MODIFIED)
+
+        self.client.patch(url, {"title": "Renamed"}, format="json")
+        response = self.client.get(url, HTTP_IF_NONE_MATCH=etag)
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(response.data["title"], "Renamed")
+
     def test_cannot_retrieve_other_users_task(self):
         """GET /api/tasks/<other_id>/ should return 404 for non-owner."""
         response = self.client.get(f"/api/tasks/{self.other_task.pk}/")
@@ -174,6 +438,36 @@ class TaskAPITest(APITestCase):
         self.assertEqual(response.data["status"], "PENDING")
         self.assertIsNone(response.data["completed_at"])
 
+    def test_toggle_explicit_status(self):
+        """PATCH /api/tasks/<id>/toggle/ with a status should set that state."""
+        response = self.client.patch(
+            f"/api/tasks/{self.task.pk}/toggle/", {"status": "PENDING"}, format="json"
+        )
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(response.data["status"], "PENDING")
+        self.assertIsNone(response.data["completed_at"])
+
+    def test_toggle_non_string_status_falls_back_to_toggle(self):
+        """A list or object status should be ignored and the task toggled, not a 500."""
+        response = self.client.patch(
+            f"/api/tasks/{self.task.pk}/toggle/", {"status": ["COMPLETED"]}, format="json"
+        )
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(response.data["status"], "COMPLETED")
+
+        response = self.client.patch(
+            f"/api/tasks/{self.task.pk}/toggle/", {"status": {"a": 1}}, format="json"
+        )
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(response.data["status"], "PENDING")
+
+    def test_cannot_toggle_other_users_task(self):
+        """PATCH /api/tasks/<other_id>/toggle/ should return 404 and leave the task alone."""
+        response = self.client.patch(f"/api/tasks/{self.other_task.pk}/toggle/")
+        self.assertEqual(response.status_code, status.HTTP_404_NOT_FOUND)
+        self.other_task.refresh_from_db(fields=["status"])
+        self.assertEqual(self.other_task.status, Task.Status.PENDING)
+
     def test_delete_task(self):
         """DELETE /api/tasks/<id>/ should remove the task."""
         response = self.client.delete(f"/api/tasks/{self.task.pk}/")
@@ -181,23 +475,23 @@ class TaskAPITest(APITestCase):
         self.assertFalse(Task.objects.filter(pk=self.task.pk).exists())
 
 
+@override_settings(PASSWORD_HASHERS=FAST_PASSWORD_HASHERS, CACHES=LOCMEM_CACHES)
 class CategoryAPITest(APITestCase):
     """Integration tests for the Category endpoints."""
 
-    def setUp(self):
-        self.user = User.objects.create_user(username="eve", password="pass1234")
-        self.other_user = User.objects.create_user(username="frank", password="pass1234")
+    @classmethod
+    def setUpTestData(cls):
+        cls.user = User.objects.create_user(username="eve", password="pass1234")
+        cls.other_user = User.objects.create_user(username="frank", password="pass1234")
 
-        response = self.client.post(
-            "/api/token/",
-            {"username": "eve", "password": "pass1234"},
-            format="json",
-        )
-        self.token = response.data["access"]
-        self.client.credentials(HTTP_AUTHORIZATION=f"Bearer {self.token}")
+        cls.category = Category.objects.create(user=cls.user, name="Personal")
+        cls.other_category = Category.objects.create(user=cls.other_user, name="Private")
 
-        self.category = Category.objects.create(user=self.user, name="Personal")
-        self.other_category = Category.objects.create(user=self.other_user, name="Private")
+    def setUp(self):
+        # Cached lists/users outlive the per-test DB rollback; start clean.
+        cache.clear()
+        self.token = str(RefreshToken.for_user(self.user).access_token)
+        self.client.credentials(HTTP_AUTHORIZATION=f"Bearer {self.token}")
 
     def test_list_returns_only_own_categories(self):
         """GET /api/categories/ should only return the requesting user's categories."""
@@ -207,6 +501,36 @@ class CategoryAPITest(APITestCase):
         self.assertIn("Personal", names)
         self.assertNotIn("Private", names)
 
+    def test_list_uses_cursor_pagination(self):
+        """GET /api/categories/ should page by cursor, without a count."""
+        Category.objects.create(user=self.user, name="Work")
+        response = self.client.get("/api/categories/", {"page_size": 1})
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertNotIn("count", response.data)
+        self.assertEqual([c["name"] for c in response.data["results"]], ["Personal"])
+
+        response = self.client.get(response.data["next"])
+        self.assertEqual([c["name"] for c in response.data["results"]], ["Work"])
+        self.assertIsNone(response.data["next"])
+
+    def test_list_reflects_changes_after_caching(self):
+        """A cached category list must be invalidated by creates and deletes."""
+        self.client.get("/api/categories/")
+        self.client.post("/api/categories/", {"name": "Hobbies"}, format="json")
+        self.category.delete()
+        response = self.client.get("/api/categories/")
+        names = [c["name"] for c in response.data["results"]]
+        self.assertIn("Hobbies", names)
+        self.assertNotIn("Personal", names)
+
+    def test_list_reflects_owner_rename_after_caching(self):
+        """Renaming the owner must invalidate cached lists that show the username."""
+        self.client.get("/api/categories/")
+        self.user.username = "eve2"
+        self.user.save(update_fields=["username"])
+        response = self.client.get("/api/categories/")
+        self.assertEqual({c["user"] for c in response.data["results"]}, {"eve2"})
+
     def test_create_category(self):
         """POST /api/categories/ should create a category owned by the requesting user."""
         response = self.client.post("/api/categories/", {"name": "Hobbies"}, format="json")
@@ -234,3 +558,114 @@ class CategoryAPITest(APITestCase):
         }
         response = self.client.post("/api/tasks/", payload, format="json")
         self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
+
+
+@override_settings(PASSWORD_HASHERS=FAST_PASSWORD_HASHERS)
+class RegisterAPITest(APITestCase):
+    """Integration tests for the public registration endpoint."""
+
+    def test_register_creates_user(self):
+        """POST /api/register/ should create a new account."""
+        payload = {"username": "grace", "password": "s3cure-pass"}
+        response = self.client.post("/api/register/", payload, format="json")
+        self.assertEqual(response.status_code, status.HTTP_201_CREATED)
+        self.assertTrue(User.objects.filter(username="grace").exists())
+
+    def test_duplicate_username_rejected_case_insensitively(self):
+        """Registering a username that differs only in case should return 400."""
+        User.objects.create_user(username="heidi", password="pass1234")
+        payload = {"username": "HEIDI", "password": "s3cure-pass"}
+        response = self.client.post("/api/register/", payload, format="json")
+        self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
+        self.assertIn("username", response.data)
+
+
+class FrontendPageTest(TestCase):
+    """The static frontend pages should be cacheable and revalidate via ETag."""
+
+    def setUp(self):
+        # Pages rendered by earlier tests would otherwise be served from memory.
+        _rendered_pages.clear()
+
+    def test_page_conditional_get(self):
+        """GET /dashboard/ should return an ETag and honour If-None-Match."""
+        response = self.client.get("/dashboard/")
+        self.assertEqual(response.status_code, 200)
+        self.assertIn("public", response["Cache-Control"])
+        etag = response["ETag"]
+
+        response = self.client.get("/dashboard/", HTTP_IF_NONE_MATCH=etag)
+        self.assertEqual(response.status_code, 304)
+        self.assertEqual(response.content, b"")
+
+    @override_settings(DEBUG=True)
+    def test_page_not_cached_in_debug(self):
+        """With DEBUG on, pages are re-rendered per request and not pinned by max-age."""
+        with mock.patch("taskmanager.views.render_to_string", return_value="<p>v1</p>"):
+            self.client.get("/tasks/")
+        with mock.patch("taskmanager.views.render_to_string", return_value="<p>v2</p>"):
+            response = self.client.get("/tasks/")
+        self.assertEqual(response.content, b"<p>v2</p>")
+        self.assertIn("no-cache", response["Cache-Control"])
+        self.assertNotIn("max-age", response["Cache-Control"])
+
+    def test_render_pages_writes_each_route(self):
+        """render_pages should write the page served at each frontend route."""
+        with tempfile.TemporaryDirectory() as output_dir:
+            call_command("render_pages", output_dir=output_dir, stdout=StringIO())
+            with open(os.path.join(output_dir, "dashboard", "index.html"), "rb") as f:
+                self.assertEqual(f.read(), self.client.get("/dashboard/").content)
+            self.assertTrue(os.path.exists(os.path.join(output_dir, "index.html")))
+
+
+class ORJSONRendererTest(TestCase):
+    """ORJSONRenderer should render everything JSONRenderer does, identically."""
+
+    def test_matches_json_renderer_for_awkward_payloads(self):
+        """Int-keyed validation errors and >64-bit ints must not turn into 500s."""
+        payloads = [
+            {"tags": {0: ["Not a valid string."]}},
+            {"value": 2 ** 70},
+        ]
+        for data in payloads:
+            with self.subTest(data=data):
+                self.assertEqual(ORJSONRenderer().render(data), JSONRenderer().render(data))
+
+
+class TokenAPIMiddlewareTest(TestCase):
+    """Stateful middleware should pass JWT API requests straight through."""
+
+    def setUp(self):
+        self.factory = RequestFactory()
+        self.middleware = SessionMiddleware(lambda request: HttpResponse())
+
+    def test_session_skipped_for_token_api_request(self):
+        """A Bearer request under /api/ should not get a session attached."""
+        request = self.factory.get("/api/tasks/", HTTP_AUTHORIZATION="Bearer abc")
+        self.middleware(request)
+        self.assertFalse(hasattr(request, "session"))
+
+    def test_session_kept_without_token(self):
+        """Requests without a token (admin, session API use) keep the session."""
+        for path in ("/api/tasks/", "/admin/"):
+            request = self.factory.get(path)
+            self.middleware(request)
+            self.assertTrue(hasattr(request, "session"))
+
+
+@override_settings(CACHES=LOCMEM_CACHES)
+class DeployCheckTest(TestCase):
+    """Deploy checks for settings the API relies on."""
+
+    def test_blacklist_on_process_local_cache_is_an_error(self):
+        """Blacklisting refresh tokens in LocMemCache should fail api.E001."""
+        errors = check_token_blacklist_cache(None)
+        self.assertEqual([e.id for e in errors], ["api.E001"])
+
+    @override_settings(CACHES={"default": {
+        "BACKEND": "django.core.cache.backends.redis.RedisCache",
+        "LOCATION": "redis://127.0.0.1:6379",
+    }})
+    def test_blacklist_on_shared_cache_passes(self):
+        """A shared cache backend satisfies the blacklist check."""
+        self.assertEqual(check_token_blacklist_cache(None), [])
@@ -9,5 +9,5 @@ router.register(r"tasks", TaskViewSet, basename="task")
 
 urlpatterns = [
     path("", include(router.urls)),
-    path("register/", RegisterView.as_view(), name="register"),
+    path("register/", RegisterView.as_view(), name="api_register"),
 ]
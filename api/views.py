@@ -1,23 +1,90 @@
-from django_filters.rest_framework import DjangoFilterBackend
+import hashlib
+
+from django.core.cache import cache
+from django.core.exceptions import ValidationError as DjangoValidationError
+from django.db import transaction
+from django.http import Http404
+from django.utils.cache import get_conditional_response
+from django.utils.http import quote_etag
 from rest_framework import filters, generics, status, viewsets
 from rest_framework.decorators import action
+from rest_framework.exceptions import ValidationError
 from rest_framework.permissions import AllowAny, IsAuthenticated
 from rest_framework.response import Response
 
+from .cache import CATEGORY_LIST_CACHE_TIMEOUT, category_list_cache_key
 from .models import Category, Task
-from .serializers import CategorySerializer, TaskSerializer, UserRegisterSerializer
+from .pagination import TaskPagination
+from .serializers import (
+    CategorySerializer,
+    TaskListSerializer,
+    TaskSerializer,
+    UserRegisterSerializer,
+)
 
 
+# TextChoices.values rebuilds a list on every access; resolve it once.
+TASK_STATUS_VALUES = frozenset(Task.Status.values)
+
+
+
+# Shared
+
+class SharedFilterBackendsMixin:
+    """
+    Reuse one instance of each filter backend across requests.
+
+    GenericAPIView.filter_queryset() instantiates every backend on every
+    request; the search/ordering backends hold no per-request state, so one
+    instance per view class is enough.
+    """
+
+    def filter_queryset(self, queryset):
+        cls = type(self)
+        backends = cls.__dict__.get("_filter_backend_instances")
+        if backends is None:
+            backends = tuple(backend() for backend in self.filter_backends)
+            cls._filter_backend_instances = backends
+        for backend in backends:
+            queryset = backend.filter_queryset(self.request, queryset, self)
+        return queryset
+
+
+class ConditionalRetrieveMixin:
+    """
+    ETag support for single-object GETs.
+
+    Views using it define `get_etag_parts(obj)`, returning the values the
+    serialized object depends on (e.g. pk and updated_at, plus any related
+    names it renders). When the client's If-None-Match matches, the view
+    answers 304 Not Modified without running the serializer or renderer.
+    """
+
+    def retrieve(self, request, *args, **kwargs):
+        instance = self.get_object()
+        raw = "|".join(str(part) for part in self.get_etag_parts(instance))
+        etag = quote_etag(hashlib.md5(raw.encode(), usedforsecurity=False).hexdigest())
+
+        response = get_conditional_response(request, etag=etag)
+        if response is not None:
+            response["ETag"] = etag
+            return response
+
+        serializer = self.get_serializer(instance)
+        return Response(serializer.data, headers={"ETag": etag})
+
 
 # Category ViewSet
 
-class CategoryViewSet(viewsets.ModelViewSet):
+class CategoryViewSet(
+    ConditionalRetrieveMixin, SharedFilterBackendsMixin, viewsets.ModelViewSet
+):
     """
     CRUD endpoints for the authenticated user's categories.
 
     list:   GET  /api/categories/
     create: POST /api/categories/
-    read:   GET  /api/categories/<id>/
+    read:   GET  /api/categories/<id>/  (ETag / If-None-Match aware)
     update: PUT  /api/categories/<id>/
     partial_update: PATCH /api/categories/<id>/
     delete: DELETE /api/categories/<id>/
@@ -34,7 +101,26 @@ class CategoryViewSet(viewsets.ModelViewSet):
 
     def get_queryset(self):
         """Return only the categories belonging to the current user."""
-        return Category.objects.filter(user=self.request.user)
+        # CategorySerializer renders the owner's username on every row.
+        return Category.objects.filter(user=self.request.user).select_related("user")
+
+    def list(self, request, *args, **kwargs):
+        """
+        Serve the user's category list from cache.
+
+        Entries are keyed by the full request URL and invalidated by the
+        Category save/delete signals (see api/signals.py).
+        """
+        key = category_list_cache_key(request.user.pk, request.build_absolute_uri())
+        data = cache.get(key)
+        if data is None:
+            data = super().list(request, *args, **kwargs).data
+            cache.set(key, data, CATEGORY_LIST_CACHE_TIMEOUT)
+        return Response(data)
+
+    def get_etag_parts(self, category):
+        # Every field CategorySerializer renders.
+        return [category.pk, category.name, category.user.username, category.created_at]
 
     def perform_create(self, serializer):
         """Automatically assign the category to the current user."""
@@ -43,13 +129,15 @@ class CategoryViewSet(viewsets.ModelViewSet):
 
 # Task ViewSet
 
-class TaskViewSet(viewsets.ModelViewSet):
+class TaskViewSet(
+    ConditionalRetrieveMixin, SharedFilterBackendsMixin, viewsets.ModelViewSet
+):
     """
     CRUD endpoints for the authenticated user's tasks.
 
     list:   GET  /api/tasks/
-    create: POST /api/tasks/
-    read:   GET  /api/tasks/<id>/
+    create: POST /api/tasks/  (object, or array for bulk create)
+    read:   GET  /api/tasks/<id>/  (ETag / If-None-Match aware)
     update: PUT  /api/tasks/<id>/
     partial_update: PATCH /api/tasks/<id>/
     delete: DELETE /api/tasks/<id>/
@@ -59,15 +147,34 @@ class TaskViewSet(viewsets.ModelViewSet):
     serializer_class = TaskSerializer
     permission_classes = [IsAuthenticated]
 
+    # Page-number by default; ?cursor= switches to keyset pagination.
+    pagination_class = TaskPagination
+
+    # Columns loaded for list responses (see TaskListSerializer).
+    LIST_FIELDS = [
+        "id",
+        "user_id",
+        "title",
+        "description",
+        "due_date",
+        "priority",
+        "status",
+        "completed_at",
+        "created_at",
+        "category__name",
+    ]
+
     # Filter / search / ordering backends
 
     filter_backends = [
-        DjangoFilterBackend,
         filters.SearchFilter,
         filters.OrderingFilter,
     ]
 
-    filterset_fields = ["priority", "status", "due_date", "category"]
+    # Exact-match filters, applied by filter_queryset() without building a
+    # django-filter FilterSet per request:
+    #   /api/tasks/?priority=HIGH&status=PENDING
+    exact_filter_fields = ["priority", "status", "due_date", "category"]
 
     # Full-text search across title and description:
     #   /api/tasks/?search=meeting
@@ -81,14 +188,75 @@ class TaskViewSet(viewsets.ModelViewSet):
 
 
     def get_queryset(self):
-        """Return only the tasks belonging to the current user."""
-        return Task.objects.filter(user=self.request.user).select_related("category")
+        """
+        Return only the tasks belonging to the current user.
+
+        Lists load just the columns TaskListSerializer renders. Other actions
+        join `user` and `category` up front because TaskSerializer renders
+        both the owner's username and `category_name`.
+        """
+        queryset = Task.objects.filter(user=self.request.user)
+        if self.action == "list":
+            return queryset.select_related("category").only(*self.LIST_FIELDS)
+        return queryset.select_related("user", "category")
+
+    def filter_queryset(self, queryset):
+        """Apply the exact-match query-param filters, then search/ordering."""
+        params = self.request.query_params
+        lookups = {}
+        for name in self.exact_filter_fields:
+            value = params.get(name)
+            if value:
+                lookups[name] = self.parse_filter_value(name, value)
+        if lookups:
+            queryset = queryset.filter(**lookups)
+        return super().filter_queryset(queryset)
+
+    def parse_filter_value(self, name, value):
+        """Convert a query-param value for model field `name`, or raise a 400."""
+        field = Task._meta.get_field(name)
+        try:
+            value = field.to_python(value)
+            if not field.is_relation:
+                field.validate(value, None)     # checks choices
+        except DjangoValidationError as e:
+            raise ValidationError({name: e.messages})
+        if field.is_relation and not field.related_model.objects.filter(
+            pk=value, user=self.request.user
+        ).exists():
+            # Same 400 as a ModelChoiceFilter, limited to the user's own rows.
+            raise ValidationError({name: [
+                "Select a valid choice. That choice is not one of the available choices."
+            ]})
+        return value
+
+    def get_serializer_class(self):
+        if self.action == "list":
+            return TaskListSerializer
+        return TaskSerializer
+
+    def get_etag_parts(self, task):
+        # updated_at moves on every write to the task itself; the related
+        # names are rendered too but live on other rows.
+        return [
+            task.pk,
+            task.updated_at.isoformat(),
+            task.category.name if task.category else "",
+            task.user.username,
+        ]
+
+    def get_serializer(self, *args, **kwargs):
+        """Accept a JSON array on create for bulk task creation."""
+        if self.action == "create" and isinstance(kwargs.get("data"), list):
+            kwargs["many"] = True
+        return super().get_serializer(*args, **kwargs)
 
     def perform_create(self, serializer):
         """Automatically assign the task to the current user."""
         serializer.save(user=self.request.user)
 
     @action(detail=True, methods=["patch"], url_path="toggle")
+    @transaction.atomic
     def toggle(self, request, pk=None):
         """
         PATCH /api/tasks/<id>/toggle/
@@ -96,23 +264,25 @@ class TaskViewSet(viewsets.ModelViewSet):
         Toggle a task between PENDING and COMPLETED.
         Optionally accept {"status": "COMPLETED"} or {"status": "PENDING"}
         in the request body to set an explicit state instead of toggling.
+
+        Responds with {"id", "status", "completed_at"} only.
         """
-        task = self.get_object()
         new_status = request.data.get("status")
-
-        if new_status == Task.Status.COMPLETED:
-            task.mark_complete()
-        elif new_status == Task.Status.PENDING:
-            task.mark_incomplete()
-        else:
-            # Simple toggle: flip current state
-            if task.status == Task.Status.PENDING:
-                task.mark_complete()
-            else:
-                task.mark_incomplete()
-
-        serializer = self.get_serializer(task)
-        return Response(serializer.data, status=status.HTTP_200_OK)
+        if not isinstance(new_status, str) or new_status not in TASK_STATUS_VALUES:
+            new_status = None       # simple toggle: flip current state
+
+        # Single conditional UPDATE scoped to the user — no load-modify-save.
+        try:
+            updated = Task.objects.toggle(pk, request.user, status=new_status)
+        except (TypeError, ValueError):
+            updated = 0     # malformed pk, same as get_object_or_404
+        if not updated:
+            raise Http404
+
+        # Return only what changed instead of re-serializing the whole task.
+        # Same transaction as the UPDATE, so this reads the row we just wrote.
+        data = Task.objects.filter(pk=pk).values("id", "status", "completed_at").get()
+        return Response(data, status=status.HTTP_200_OK)
 
 
 
@@ -0,0 +1,53 @@
+"""
+Stateful middleware that stands aside for token-authenticated API requests.
+
+API clients authenticate with a JWT in the Authorization header and never use
+sessions, CSRF cookies or flash messages, so for those requests the session,
+CSRF, authentication and messages middleware pass straight through. Requests
+without a token (admin, frontend pages, the browsable API with a session
+login, /api/token/) get the normal stack.
+
+The classes subclass Django's own so the admin's MIDDLEWARE checks still
+recognise them.
+"""
+
+from django.contrib.auth.middleware import AuthenticationMiddleware as BaseAuthenticationMiddleware
+from django.contrib.messages.middleware import MessageMiddleware as BaseMessageMiddleware
+from django.contrib.sessions.middleware import SessionMiddleware as BaseSessionMiddleware
+from django.middleware.csrf import CsrfViewMiddleware as BaseCsrfViewMiddleware
+
+
+API_PREFIX = "/api/"
+
+
+def is_token_api_request(request):
+    """True for API requests carrying an Authorization header."""
+    return "HTTP_AUTHORIZATION" in request.META and request.path_info.startswith(API_PREFIX)
+
+
+class SkipForTokenAPIMixin:
+    """Bypass the middleware entirely for token-authenticated API requests."""
+
+    def __call__(self, request):
+        if is_token_api_request(request):
+            return self.get_response(request)
+        return super().__call__(request)
+
+
+class SessionMiddleware(SkipForTokenAPIMixin, BaseSessionMiddleware):
+    pass
+
+
+class CsrfViewMiddleware(SkipForTokenAPIMixin, BaseCsrfViewMiddleware):
+    def process_view(self, request, callback, callback_args, callback_kwargs):
+        if is_token_api_request(request):
+            return None
+        return super().process_view(request, callback, callback_args, callback_kwargs)
+
+
+class AuthenticationMiddleware(SkipForTokenAPIMixin, BaseAuthenticationMiddleware):
+    pass
+
+
+class MessageMiddleware(SkipForTokenAPIMixin, BaseMessageMiddleware):
+    pass
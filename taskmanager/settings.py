@@ -1,8 +1,9 @@
+import os
 from pathlib import Path
 from datetime import timedelta
 
 
-BASE_DIR = Path(__file__).resolve().parent.parent
+BASE_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
 
 SECRET_KEY = "django-insecure-change-me-before-production"
 DEBUG = True
@@ -28,13 +29,17 @@ INSTALLED_APPS = [
     "api",                          # My Task Management app
 ]
 
+# Session, CSRF, auth and messages are the Django middleware wrapped to pass
+# straight through for JWT-authenticated /api/ requests (taskmanager/middleware.py).
 MIDDLEWARE = [
     "django.middleware.security.SecurityMiddleware",
-    "django.contrib.sessions.middleware.SessionMiddleware",
+    # Serves STATIC_URL straight from STATIC_ROOT, ahead of the rest of the stack.
+    "whitenoise.middleware.WhiteNoiseMiddleware",
+    "taskmanager.middleware.SessionMiddleware",
     "django.middleware.common.CommonMiddleware",
-    "django.middleware.csrf.CsrfViewMiddleware",
-    "django.contrib.auth.middleware.AuthenticationMiddleware",
-    "django.contrib.messages.middleware.MessageMiddleware",
+    "taskmanager.middleware.CsrfViewMiddleware",
+    "taskmanager.middleware.AuthenticationMiddleware",
+    "taskmanager.middleware.MessageMiddleware",
     "django.middleware.clickjacking.XFrameOptionsMiddleware",
 ]
 
@@ -43,7 +48,7 @@ ROOT_URLCONF = "taskmanager.urls"
 TEMPLATES = [
     {
         "BACKEND": "django.template.backends.django.DjangoTemplates",
-        "DIRS": [BASE_DIR / "templates"],
+        "DIRS": [os.path.join(BASE_DIR, "templates")],
         "APP_DIRS": True,
         "OPTIONS": {
             "context_processors": [
@@ -64,10 +69,73 @@ WSGI_APPLICATION = "taskmanager.wsgi.application"
 DATABASES = {
     "default": {
         "ENGINE": "django.db.backends.sqlite3",
-        "NAME": BASE_DIR / "db.sqlite3",
+        "NAME": os.path.join(BASE_DIR, "db.sqlite3"),
+        # No per-request transaction: read-only requests skip BEGIN/COMMIT;
+        # views that need one use transaction.atomic explicitly.
+        "ATOMIC_REQUESTS": False,
+        # Tests run against an in-memory database (no fsync per transaction).
+        "TEST": {"NAME": ":memory:"},
     }
 }
 
+# PostgreSQL — used when POSTGRES_DB is set. Connections are kept open across
+# requests (CONN_MAX_AGE) instead of reconnecting for every request, and are
+# checked before reuse so a dropped connection is replaced transparently.
+if os.environ.get("POSTGRES_DB"):
+    DATABASES["default"] = {
+        "ENGINE": "django.db.backends.postgresql",
+        "NAME": os.environ["POSTGRES_DB"],
+        "USER": os.environ.get("POSTGRES_USER", ""),
+        "PASSWORD": os.environ.get("POSTGRES_PASSWORD", ""),
+        "HOST": os.environ.get("POSTGRES_HOST", ""),
+        "PORT": os.environ.get("POSTGRES_PORT", ""),
+        "ATOMIC_REQUESTS": False,
+        "CONN_MAX_AGE": int(os.environ.get("POSTGRES_CONN_MAX_AGE", 600)),
+        "CONN_HEALTH_CHECKS": True,
+        # QuerySet.iterator() streams rows through a server-side cursor.
+        # Set POSTGRES_DISABLE_SERVER_SIDE_CURSORS=1 behind a transaction-
+        # pooling PgBouncer, which can't keep a cursor across transactions.
+        "DISABLE_SERVER_SIDE_CURSORS": os.environ.get(
+            "POSTGRES_DISABLE_SERVER_SIDE_CURSORS", ""
+        ).lower() in ("1", "true", "yes"),
+    }
+
+
+# Cache — used for authenticated-user lookups and the refresh-token blacklist
+# (see api/auth.py).
+# Local memory is per-process, so the cached user lookup is switched off with
+# it (other workers couldn't be invalidated); in production point this at a
+# shared store,
+# e.g. "django.core.cache.backends.redis.RedisCache" with
+# "LOCATION": "redis://127.0.0.1:6379".
+CACHES = {
+    "default": {
+        "BACKEND": "django.core.cache.backends.locmem.LocMemCache",
+    }
+}
+
+# Outside DEBUG (or whenever REDIS_URL is set) use Redis, so the refresh-token
+# blacklist and cache invalidation are seen by every worker process.
+# `manage.py check --deploy` fails (api.E001) if blacklisting is on while the
+# cache is per-process.
+REDIS_URL = os.environ.get("REDIS_URL")
+if REDIS_URL or not DEBUG:
+    CACHES["default"] = {
+        "BACKEND": "django.core.cache.backends.redis.RedisCache",
+        "LOCATION": REDIS_URL or "redis://127.0.0.1:6379",
+    }
+
+
+# Password hashing — Argon2 (argon2-cffi) for new hashes; PBKDF2 and friends
+# stay listed so existing hashes still verify and are upgraded on login.
+PASSWORD_HASHERS = [
+    "django.contrib.auth.hashers.Argon2PasswordHasher",
+    "django.contrib.auth.hashers.PBKDF2PasswordHasher",
+    "django.contrib.auth.hashers.PBKDF2SHA1PasswordHasher",
+    "django.contrib.auth.hashers.BCryptSHA256PasswordHasher",
+    "django.contrib.auth.hashers.ScryptPasswordHasher",
+]
+
 
 # Password validation
 
@@ -89,7 +157,28 @@ USE_TZ = True
 # Static files
 
 STATIC_URL = "static/"
-STATICFILES_DIRS = [BASE_DIR / "static"]
+STATICFILES_DIRS = [os.path.join(BASE_DIR, "static")]
+STATIC_ROOT = os.path.join(BASE_DIR, "staticfiles")
+
+# Development (and the test runner, which flips DEBUG off at runtime) serves
+# static files straight from STATICFILES_DIRS via the finders, so WhiteNoise
+# doesn't expect a collectstatic'ed STATIC_ROOT to exist.
+WHITENOISE_USE_FINDERS = DEBUG
+WHITENOISE_AUTOREFRESH = DEBUG
+
+# collectstatic writes content-hashed copies plus gzip and Brotli variants of
+# each file; WhiteNoise serves the precompressed bytes with far-future cache
+# headers. Development keeps the plain storage (no manifest to rebuild).
+STORAGES = {
+    "default": {"BACKEND": "django.core.files.storage.FileSystemStorage"},
+    "staticfiles": {
+        "BACKEND": (
+            "django.contrib.staticfiles.storage.StaticFilesStorage"
+            if DEBUG
+            else "whitenoise.storage.CompressedManifestStaticFilesStorage"
+        ),
+    },
+}
 DEFAULT_AUTO_FIELD = "django.db.models.BigAutoField"
 
 
@@ -97,11 +186,20 @@ DEFAULT_AUTO_FIELD = "django.db.models.BigAutoField"
 # Django REST Framework configuration
 
 REST_FRAMEWORK = {
-    # Authentication: JWT is primary; SessionAuthentication kept for admin browsable API.
+    # Authentication: JWT only. API clients never use sessions, so the session
+    # lookup is skipped for them (SessionAuthentication is added below for the
+    # browsable API when DEBUG is on).
     # BasicAuthentication removed — JWT replaces it for API clients.
+    # CachedJWTAuthentication is SimpleJWT's JWTAuthentication with the user
+    # lookup served from CACHES.
     "DEFAULT_AUTHENTICATION_CLASSES": [
-        "rest_framework_simplejwt.authentication.JWTAuthentication",
-        "rest_framework.authentication.SessionAuthentication",
+        "api.auth.CachedJWTAuthentication",
+    ],
+
+    # JSON is encoded with orjson (api/renderers.py). The browsable API is
+    # added below only when DEBUG is on.
+    "DEFAULT_RENDERER_CLASSES": [
+        "api.renderers.ORJSONRenderer",
     ],
 
     # All endpoints require an authenticated user by default.
@@ -116,31 +214,61 @@ REST_FRAMEWORK = {
         "rest_framework.filters.OrderingFilter",
     ],
 
-    # Pagination — 10 items per page by default.
-    # Clients can override with ?page_size=N (capped at MAX_PAGE_SIZE=100).
-    "DEFAULT_PAGINATION_CLASS": "rest_framework.pagination.PageNumberPagination",
+    # Pagination — keyset (cursor) pagination, 10 items per page by default.
+    # Responses carry `next`/`previous` cursor URLs and no `count`; clients
+    # follow those links instead of requesting ?page=N. Clients can override
+    # the size with ?page_size=N (capped at 100). Views that need page numbers
+    # opt in per view (TaskViewSet uses api.pagination.TaskPagination).
+    "DEFAULT_PAGINATION_CLASS": "api.pagination.StandardCursorPagination",
     "PAGE_SIZE": 10,
-    "PAGE_SIZE_QUERY_PARAM": "page_size",  # allow ?page_size=N
-    "MAX_PAGE_SIZE": 100,                  # prevent abuse
 }
 
+if DEBUG:
+    # Let a logged-in admin use the browsable API during development. It runs
+    # only when no Bearer token is sent: DRF stops at the first authenticator
+    # that succeeds, and the session is loaded lazily, so JWT requests never
+    # read django_session.
+    REST_FRAMEWORK["DEFAULT_AUTHENTICATION_CLASSES"].append(
+        "rest_framework.authentication.SessionAuthentication"
+    )
+    # HTML views of the API for humans poking at endpoints in a browser.
+    REST_FRAMEWORK["DEFAULT_RENDERER_CLASSES"].append(
+        "rest_framework.renderers.BrowsableAPIRenderer"
+    )
+
 
 
 # SimpleJWT configuration
 
+# Token lifetimes in whole seconds; the timedeltas below are built from these
+# once, at import.
+ACCESS_TOKEN_LIFETIME_SECONDS = 60 * 60
+REFRESH_TOKEN_LIFETIME_SECONDS = 7 * 24 * 60 * 60
+
 SIMPLE_JWT = {
     # Access token expires after 60 minutes — short-lived for security.
-    "ACCESS_TOKEN_LIFETIME": timedelta(minutes=60),
+    "ACCESS_TOKEN_LIFETIME": timedelta(seconds=ACCESS_TOKEN_LIFETIME_SECONDS),
 
     # Refresh token expires after 7 days — allows clients to stay logged in.
-    "REFRESH_TOKEN_LIFETIME": timedelta(days=7),
+    "REFRESH_TOKEN_LIFETIME": timedelta(seconds=REFRESH_TOKEN_LIFETIME_SECONDS),
 
     "ROTATE_REFRESH_TOKENS": True,
-    "BLACKLIST_AFTER_ROTATION": False,
 
-    # Algorithm used to sign tokens — HS256 is the standard default.
+    # Rotated refresh tokens are blacklisted in CACHES (api/auth.py) rather
+    # than by the database-backed token_blacklist app, which stays uninstalled.
+    # Tokens are single-use only if every worker shares that cache (Redis
+    # above); LocMemCache is only good enough for single-process development.
+    "BLACKLIST_AFTER_ROTATION": True,
+    "TOKEN_REFRESH_SERIALIZER": "api.serializers.BlacklistingTokenRefreshSerializer",
+
+    # Algorithm used to sign tokens — HS256 is the standard default
+    # (switched to EdDSA below when an Ed25519 keypair is configured).
     "ALGORITHM": "HS256",
 
+    # HMAC key, encoded to bytes once here so PyJWT's key preparation has
+    # nothing to convert on each sign/verify.
+    "SIGNING_KEY": SECRET_KEY.encode(),
+
     # Header type sent with the token: "Bearer <token>"
     "AUTH_HEADER_TYPES": ("Bearer",),
 
@@ -148,3 +276,22 @@ SIMPLE_JWT = {
     "USER_ID_FIELD": "id",
     "USER_ID_CLAIM": "user_id",
 }
+
+# Ed25519 signing — set JWT_PRIVATE_KEY_PATH and JWT_PUBLIC_KEY_PATH to PEM
+# files (e.g. `openssl genpkey -algorithm ed25519`) to sign tokens with EdDSA.
+# Verification is cheaper than HMAC and only the issuer needs the private key,
+# so SECRET_KEY is no longer the token secret. Requires PyJWT[crypto].
+JWT_PRIVATE_KEY_PATH = os.environ.get("JWT_PRIVATE_KEY_PATH")
+JWT_PUBLIC_KEY_PATH = os.environ.get("JWT_PUBLIC_KEY_PATH")
+
+if JWT_PRIVATE_KEY_PATH and JWT_PUBLIC_KEY_PATH:
+    SIMPLE_JWT["ALGORITHM"] = "EdDSA"
+    SIMPLE_JWT["SIGNING_KEY"] = Path(JWT_PRIVATE_KEY_PATH).read_bytes()
+    SIMPLE_JWT["VERIFYING_KEY"] = Path(JWT_PUBLIC_KEY_PATH).read_bytes()
+
+# Process-local cache of verified access tokens (api/auth.py). Entries live
+# at most `ttl` seconds and never past the token's own expiry.
+JWT_VERIFICATION_CACHE = {
+    "max_entries": 10000,
+    "ttl": 30,
+}
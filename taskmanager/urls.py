@@ -2,30 +2,33 @@ from django.contrib import admin
 from django.urls import path, include
 from rest_framework_simplejwt.views import TokenObtainPairView, TokenRefreshView
 
-from .views import LoginView, RegisterView, DashboardView, TasksView, CategoriesView
+from .views import CachedPageView
 
-urlpatterns = [
+# The single project URLconf (ROOT_URLCONF). A tuple: nothing appends to it.
+# Django's resolver tries patterns in order and stops at the first match, so
+# they are listed by expected traffic: API calls first, admin last.
+urlpatterns = (
 
-    # Django admin
+    # REST API (tasks, categories, register)
+
+    path("api/", include("api.urls")),
 
-    path("admin/", admin.site.urls),
 
- 
     # JWT Auth API
 
     path("api/token/", TokenObtainPairView.as_view(), name="token_obtain_pair"),
     path("api/token/refresh/", TokenRefreshView.as_view(), name="token_refresh"),
 
 
-    # REST API (tasks, categories, register)
+    # Frontend pages — one view class, the template is set per route
+    path("", CachedPageView.as_view(template_name="login.html"), name="login"),
+    path("register/", CachedPageView.as_view(template_name="register.html"), name="register"),
+    path("dashboard/", CachedPageView.as_view(template_name="dashboard.html"), name="dashboard"),
+    path("tasks/", CachedPageView.as_view(template_name="tasks.html"), name="tasks"),
+    path("categories/", CachedPageView.as_view(template_name="categories.html"), name="categories"),
 
-    path("api/", include("api.urls")),
 
+    # Django admin
 
-    # Frontend pages
-    path("", LoginView.as_view(), name="login"),
-    path("register/", RegisterView.as_view(), name="register"),
-    path("dashboard/", DashboardView.as_view(), name="dashboard"),
-    path("tasks/", TasksView.as_view(), name="tasks"),
-    path("categories/", CategoriesView.as_view(), name="categories"),
-]
+    path("admin/", admin.site.urls),
+)
@@ -1,21 +1,52 @@
-from django.views.generic import TemplateView
-
-
-class LoginView(TemplateView):
-    template_name = "login.html"
-
-
-class RegisterView(TemplateView):
-    template_name = "register.html"
-
-
-class DashboardView(TemplateView):
-    template_name = "dashboard.html"
+import hashlib
 
+from django.conf import settings
+from django.http import HttpResponse
+from django.template.loader import render_to_string
+from django.utils.cache import get_conditional_response, patch_cache_control
+from django.utils.http import quote_etag
+from django.views.generic import TemplateView
 
-class TasksView(TemplateView):
-    template_name = "tasks.html"
 
+# The frontend pages are static shells (all data is loaded by static/js/app.js),
+# so each template is rendered once per process and served from memory. With
+# DEBUG on, pages are re-rendered on every request and browsers revalidate
+# every time, so template edits show up without restarting runserver.
+PAGE_MAX_AGE = 3600
+
+# template_name -> (html bytes, etag)
+_rendered_pages = {}
+
+
+def render_page(template_name):
+    """Return the page's HTML bytes and ETag, rendering it on first use."""
+    page = None if settings.DEBUG else _rendered_pages.get(template_name)
+    if page is None:
+        content = render_to_string(template_name).encode()
+        etag = quote_etag(hashlib.md5(content, usedforsecurity=False).hexdigest())
+        page = (content, etag)
+        if not settings.DEBUG:
+            _rendered_pages[template_name] = page
+    return page
+
+
+class CachedPageView(TemplateView):
+    """
+    Serve a request-independent template from memory with an ETag.
+
+    Browsers revalidate with If-None-Match and get an empty 304 while the
+    page is unchanged; intermediaries may cache it for PAGE_MAX_AGE seconds.
+    """
+
+    def get(self, request, *args, **kwargs):
+        content, etag = render_page(self.template_name)
+        response = get_conditional_response(request, etag=etag)
+        if response is None:
+            response = HttpResponse(content)
+        response["ETag"] = etag
+        if settings.DEBUG:
+            patch_cache_control(response, no_cache=True)
+        else:
+            patch_cache_control(response, public=True, max_age=PAGE_MAX_AGE)
+        return response
 
-class CategoriesView(TemplateView):
-    template_name = "categories.html"
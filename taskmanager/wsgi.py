@@ -1,5 +1,27 @@
+"""
+WSGI entry point.
+
+In production, serve it with gunicorn and preload the app so Django, DRF and
+the URLconf are imported once in the master process and shared copy-on-write
+by the forked workers:
+
+    gunicorn --preload -w 4 taskmanager.wsgi:application
+"""
+
 import os
+
 from django.core.wsgi import get_wsgi_application
 
 os.environ.setdefault("DJANGO_SETTINGS_MODULE", "taskmanager.settings")
 application = get_wsgi_application()
+
+from django.db import connections  # noqa: E402
+from django.urls import get_resolver  # noqa: E402
+
+# Import every view and build the URL resolver now instead of on each
+# worker's first request.
+get_resolver()._populate()
+
+# Workers must open their own database connections; never let one made while
+# loading be inherited through fork.
+connections.close_all()